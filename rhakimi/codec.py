@@ -1,8 +1,113 @@
 from __future__ import annotations
 
+import itertools
 import math
+from functools import lru_cache
 from typing import Iterable, List, Sequence
 
+try:
+    import gmpy2
+except ImportError:  # pragma: no cover - optional dependency
+    gmpy2 = None
+
+# Optional compiled accelerator.  When a _codec_impl extension module is built
+# (e.g. Cython over GMP), its entry points take over the whole hot path:
+# encode_impl(table_chars, payload) -> encoded str, and
+# decode_impl(table_chars, encoded) -> payload bytes.
+try:
+    from rhakimi._codec_impl import decode_impl, encode_impl
+except ImportError:  # pragma: no cover - optional accelerator
+    encode_impl = None
+    decode_impl = None
+
+# GMP renders bases up to 36 with lowercase letters and bases 37-62 with
+# uppercase letters before lowercase ones; both alphabets are needed to map
+# its digit strings back to integer digit values.
+_GMP_MAX_BASE = 62
+_GMP_DIGITS_LOWER = "0123456789abcdefghijklmnopqrstuvwxyz"
+_GMP_DIGITS_MIXED = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_GMP_DIGIT_VALUES_LOWER = {ch: idx for idx, ch in enumerate(_GMP_DIGITS_LOWER)}
+_GMP_DIGIT_VALUES_MIXED = {ch: idx for idx, ch in enumerate(_GMP_DIGITS_MIXED)}
+
+# Largest codebook (table_size ** codeword_length) for which decode builds a
+# full codeword -> digit lookup table instead of translating per character.
+_CODEWORD_LUT_MAX_SIZE = 1 << 20
+
+# Below these operand sizes the divide-and-conquer radix conversions fall back
+# to the direct loops; recursion overhead dominates for small values.
+_DC_MIN_BITS = 256
+_DC_MIN_DIGITS = 1024
+
+
+@lru_cache(maxsize=128)
+def _prepare(table: str) -> tuple[tuple[str, ...], dict[str, int], int]:
+    """Validate and dedupe a table.
+
+    Returns the deduped characters, the char->digit map, and the largest
+    codeword length representable in the header, so callers never recompute
+    the header-range power.
+    """
+    if len(table) < 2:
+        raise ValueError("Table must contain at least two characters.")
+    deduped = tuple(dict.fromkeys(table))
+    if len(deduped) < 2:
+        raise ValueError("Table must contain at least two distinct characters after removing duplicates.")
+    max_codeword_length = len(deduped) ** ReversibleTableCodec.LENGTH_PREFIX_WIDTH - 1
+    return deduped, {ch: idx for idx, ch in enumerate(deduped)}, max_codeword_length
+
+
+@lru_cache(maxsize=128)
+def _digit_value_map(table_chars: tuple[str, ...]) -> dict[int, int]:
+    """str.translate table mapping each table code point to its digit value."""
+    return {ord(ch): idx for idx, ch in enumerate(table_chars)}
+
+
+@lru_cache(maxsize=128)
+def _digit_char_map(table_chars: tuple[str, ...]) -> dict[int, str]:
+    """str.translate table mapping each digit value to its table character."""
+    return {idx: ch for idx, ch in enumerate(table_chars)}
+
+
+@lru_cache(maxsize=128)
+def _missing_char_map(table_chars: tuple[str, ...]) -> dict[int, None]:
+    """str.translate table deleting table characters, leaving only foreign ones."""
+    return {ord(ch): None for ch in table_chars}
+
+
+@lru_cache(maxsize=8)
+def _pow2_byte_digits(bits_per_digit: int) -> List[tuple]:
+    """Map every byte value to its digits when each digit spans 1, 2, or 4 bits."""
+    digits_per_byte = 8 // bits_per_digit
+    mask = (1 << bits_per_digit) - 1
+    return [
+        tuple((byte >> (bits_per_digit * (digits_per_byte - 1 - i))) & mask for i in range(digits_per_byte))
+        for byte in range(256)
+    ]
+
+
+@lru_cache(maxsize=32)
+def _byte_codeword_lut(table_chars: tuple[str, ...]) -> List[str]:
+    """Map each byte value to its run of table characters.
+
+    Only valid for power-of-two tables whose digit width tiles a byte
+    (1, 2, 4, or 8 bits per digit).
+    """
+    bits_per_digit = len(table_chars).bit_length() - 1
+    if bits_per_digit == 8:
+        return list(table_chars)
+    byte_digits = _pow2_byte_digits(bits_per_digit)
+    return ["".join(table_chars[digit] for digit in byte_digits[byte]) for byte in range(256)]
+
+
+@lru_cache(maxsize=32)
+def _codeword_array(table_chars: tuple[str, ...], codeword_length: int) -> List[str]:
+    return ["".join(chars) for chars in itertools.product(table_chars, repeat=codeword_length)]
+
+
+@lru_cache(maxsize=32)
+def _codeword_lookup(table_chars: tuple[str, ...], codeword_length: int) -> dict[str, int]:
+    return {codeword: digit for digit, codeword in enumerate(_codeword_array(table_chars, codeword_length))}
+
 
 class ReversibleTableCodec:
     """
@@ -14,51 +119,100 @@ class ReversibleTableCodec:
     LENGTH_PREFIX_WIDTH = 4  # number of single-char digits (base=len(table)) that store the codeword length
 
     def encode(self, table: str, text: str) -> str:
-        table_chars = self._validate_table(table)
+        table_chars, _, max_codeword_length = self._prepare_table(table)
         payload = text.encode("utf-8")
-        prefixed = len(payload).to_bytes(self.LENGTH_FIELD_BYTES, "big") + payload
-        sentinel_prefixed = b"\x01" + prefixed
-        integer_value = int.from_bytes(sentinel_prefixed, "big")
-
-        codeword_length = self._choose_codeword_length(len(table_chars), integer_value)
-        base = len(table_chars) ** codeword_length
-        digits = self._int_to_base_digits(integer_value, base)
-
-        header = self._encode_length_prefix(codeword_length, len(table_chars), table_chars)
-        encoded_body = "".join(
-            self._digit_to_codeword(digit, codeword_length, len(table_chars), table_chars)
-            for digit in digits
-        )
+        if encode_impl is not None:
+            return encode_impl(table_chars, payload)
+        # Assemble sentinel + length prefix + payload in one preallocated buffer.
+        buf = bytearray(1 + self.LENGTH_FIELD_BYTES + len(payload))
+        buf[0] = 1
+        buf[1 : 1 + self.LENGTH_FIELD_BYTES] = len(payload).to_bytes(self.LENGTH_FIELD_BYTES, "big")
+        buf[1 + self.LENGTH_FIELD_BYTES :] = payload
+
+        table_size = len(table_chars)
+        if table_size & (table_size - 1) == 0 and 8 % (table_size.bit_length() - 1) == 0:
+            # Power-of-two tables whose digit width tiles a byte never need the
+            # integer lift: stream the buffer through a cached byte -> codeword
+            # table.  Total output length is minimized at single-character
+            # codewords (see _choose_codeword_length), so the header is fixed.
+            header = self._encode_length_prefix(1, table_size, table_chars, max_codeword_length)
+            byte_lut = _byte_codeword_lut(table_chars)
+            return header + "".join(map(byte_lut.__getitem__, buf))
+        integer_value = int.from_bytes(buf, "big")
+        codeword_length = self._choose_codeword_length(table_size, integer_value, max_codeword_length)
+        header = self._encode_length_prefix(codeword_length, table_size, table_chars, max_codeword_length)
+
+        base = table_size**codeword_length
+        if codeword_length > 1 and base <= _CODEWORD_LUT_MAX_SIZE:
+            codeword_array = _codeword_array(table_chars, codeword_length)
+            digits = self._int_to_base_digits(integer_value, base)
+            encoded_body = "".join(map(codeword_array.__getitem__, digits))
+        else:
+            digits = self._int_to_base_digits(integer_value, table_size)
+            padding = -len(digits) % codeword_length
+            if padding:
+                digits = [0] * padding + digits
+            if table_size <= 256:
+                # Realize the digit list as bytes and translate at C speed.
+                encoded_body = bytes(digits).decode("latin-1").translate(_digit_char_map(table_chars))
+            else:
+                encoded_body = "".join(map(table_chars.__getitem__, digits))
         return header + encoded_body
 
     def decode(self, table: str, encoded: str) -> str:
-        table_chars = self._validate_table(table)
-        char_to_value = {ch: idx for idx, ch in enumerate(table_chars)}
+        table_chars, _, max_codeword_length = self._prepare_table(table)
 
         if len(encoded) < self.LENGTH_PREFIX_WIDTH:
             raise ValueError("Encoded text is too short to contain header.")
 
-        codeword_length = self._decode_length_prefix(encoded[: self.LENGTH_PREFIX_WIDTH], char_to_value, len(table_chars))
+        if decode_impl is not None:
+            try:
+                return decode_impl(table_chars, encoded).decode("utf-8")
+            except UnicodeDecodeError as exc:
+                raise ValueError("Decoded bytes are not valid UTF-8.") from exc
+
+        leftovers = encoded.translate(_missing_char_map(table_chars))
+        if leftovers:
+            raise ValueError(f"Encountered character {repr(leftovers[0])} that is not in the table.")
+        # After the foreign-character check, every code point in `mapped` is a
+        # valid digit value.
+        mapped = encoded.translate(_digit_value_map(table_chars))
+
+        codeword_length = self._decode_length_prefix(mapped[: self.LENGTH_PREFIX_WIDTH], len(table_chars), max_codeword_length)
         if codeword_length < 1:
             raise ValueError("Encoded codeword length is invalid.")
 
-        base = len(table_chars) ** codeword_length
         body = encoded[self.LENGTH_PREFIX_WIDTH :]
         if len(body) % codeword_length != 0:
             raise ValueError("Encoded text length is not aligned to the expected codeword length.")
 
-        digits: List[int] = []
-        for i in range(0, len(body), codeword_length):
-            codeword = body[i : i + codeword_length]
-            digit = self._codeword_to_digit(codeword, codeword_length, char_to_value, len(table_chars))
-            digits.append(digit)
-
-        integer_value = self._base_digits_to_int(digits, base)
-        raw_bytes = integer_value.to_bytes(max(1, (integer_value.bit_length() + 7) // 8), "big")
+        table_size = len(table_chars)
+        if table_size & (table_size - 1) == 0:
+            # Power-of-two tables stream digits straight into bytes without
+            # reconstructing the payload integer (or its base).
+            digits = list(map(ord, mapped[self.LENGTH_PREFIX_WIDTH :]))
+            raw_bytes = self._pow2_digits_to_bytes(digits, table_size)
+        else:
+            base = table_size**codeword_length
+            if codeword_length > 1 and base <= _CODEWORD_LUT_MAX_SIZE:
+                codeword_lut = _codeword_lookup(table_chars, codeword_length)
+                digits = []
+                for i in range(0, len(body), codeword_length):
+                    digit = codeword_lut.get(body[i : i + codeword_length])
+                    if digit is None:
+                        raise ValueError("Encountered a codeword that is outside of the codebook.")
+                    digits.append(digit)
+                integer_value = self._base_digits_to_int(digits, base)
+            else:
+                digits = list(map(ord, mapped[self.LENGTH_PREFIX_WIDTH :]))
+                integer_value = self._base_digits_to_int(digits, table_size)
+            raw_bytes = integer_value.to_bytes(max(1, (integer_value.bit_length() + 7) // 8), "big")
         if not raw_bytes or raw_bytes[0] != 1:
             raise ValueError("Missing sentinel byte; encoded payload is corrupted.")
 
-        prefixed = raw_bytes[1:]
+        # Slice through a memoryview so the sentinel/length/payload splits do
+        # not copy the underlying buffer.
+        prefixed = memoryview(raw_bytes)[1:]
         if len(prefixed) < self.LENGTH_FIELD_BYTES:
             raise ValueError("Encoded payload is too short to contain the length prefix.")
 
@@ -67,83 +221,80 @@ class ReversibleTableCodec:
         if len(prefixed) != expected_total:
             raise ValueError("Decoded payload length is inconsistent with the declared length.")
 
-        payload = prefixed[self.LENGTH_FIELD_BYTES :]
-
         try:
-            return payload.decode("utf-8")
+            return str(prefixed[self.LENGTH_FIELD_BYTES :], "utf-8")
         except UnicodeDecodeError as exc:
             raise ValueError("Decoded bytes are not valid UTF-8.") from exc
 
-    def _validate_table(self, table: str) -> Sequence[str]:
-        if len(table) < 2:
-            raise ValueError("Table must contain at least two characters.")
-
-        seen = set()
-        deduped = []
-        for ch in table:
-            if ch in seen:
-                continue
-            seen.add(ch)
-            deduped.append(ch)
-
-        if len(deduped) < 2:
-            raise ValueError("Table must contain at least two distinct characters after removing duplicates.")
-        return deduped
+    @staticmethod
+    def _prepare_table(table: str) -> tuple[tuple[str, ...], dict[str, int], int]:
+        return _prepare(table)
 
-    def _choose_codeword_length(self, table_size: int, integer_value: int) -> int:
-        max_length = (table_size**self.LENGTH_PREFIX_WIDTH) - 1
+    def _choose_codeword_length(self, table_size: int, integer_value: int, max_length: int) -> int:
         if max_length < 1:
             raise ValueError("Table cannot represent any codeword length.")
 
+        # Number of base-`table_size` digits of the payload integer, derived from
+        # the bit length and corrected with exact comparisons instead of a
+        # division loop over the bignum.
+        bit_length = integer_value.bit_length()
+        base_digits = max(1, int(bit_length / math.log2(table_size)))
+        while table_size**base_digits <= integer_value:
+            base_digits += 1
+        while base_digits > 1 and table_size ** (base_digits - 1) > integer_value:
+            base_digits -= 1
+
+        # A length-L codebook emits ceil(base_digits / L) codewords, i.e.
+        # L * ceil(base_digits / L) table characters in total.  Scan only the
+        # feasible lengths with plain arithmetic and stop as soon as the lower
+        # bound of `base_digits` characters is reached.
         best_length = 1
         best_encoded_chars = math.inf
-        for length in range(1, max_length + 1):
-            base = table_size**length
-            digits = self._count_digits(integer_value, base)
-            encoded_chars = digits * length
+        for length in range(1, min(max_length, base_digits) + 1):
+            encoded_chars = length * -(-base_digits // length)
             if encoded_chars < best_encoded_chars:
                 best_encoded_chars = encoded_chars
                 best_length = length
+            if encoded_chars == base_digits:
+                break
         return best_length
 
-    def _encode_length_prefix(self, length: int, table_size: int, table_chars: Sequence[str]) -> str:
-        max_length = (table_size**self.LENGTH_PREFIX_WIDTH) - 1
+    def _encode_length_prefix(self, length: int, table_size: int, table_chars: Sequence[str], max_length: int) -> str:
         if length < 1 or length > max_length:
             raise ValueError("Codeword length does not fit in the header.")
+        if self.LENGTH_PREFIX_WIDTH == 4:
+            # Unrolled for the fixed four-digit header: three divmods, no list.
+            squared = table_size * table_size
+            d0, rest = divmod(length, squared * table_size)
+            d1, rest = divmod(rest, squared)
+            d2, d3 = divmod(rest, table_size)
+            return table_chars[d0] + table_chars[d1] + table_chars[d2] + table_chars[d3]
         digits = self._int_to_base_fixed_width(length, table_size, self.LENGTH_PREFIX_WIDTH)
         return "".join(table_chars[d] for d in digits)
 
-    def _decode_length_prefix(self, prefix: str, char_to_value: dict[str, int], table_size: int) -> int:
-        digits = [self._lookup_value(ch, char_to_value) for ch in prefix]
-        length = self._base_digits_to_int(digits, table_size)
-        max_length = (table_size**self.LENGTH_PREFIX_WIDTH) - 1
+    def _decode_length_prefix(self, prefix: str, table_size: int, max_length: int) -> int:
+        # The prefix digits were validated against the table by the caller.
+        if self.LENGTH_PREFIX_WIDTH == 4:
+            d0, d1, d2, d3 = map(ord, prefix)
+            length = ((d0 * table_size + d1) * table_size + d2) * table_size + d3
+        else:
+            length = self._base_digits_to_int([ord(ch) for ch in prefix], table_size)
         if length > max_length:
             raise ValueError("Header declares a codeword length that exceeds the representable range.")
         return length
 
-    def _digit_to_codeword(self, digit: int, codeword_length: int, table_size: int, table_chars: Sequence[str]) -> str:
-        max_digit = table_size**codeword_length
-        if digit < 0 or digit >= max_digit:
-            raise ValueError("Digit out of range for the current codebook.")
-        indices = self._int_to_base_fixed_width(digit, table_size, codeword_length)
-        return "".join(table_chars[i] for i in indices)
-
-    def _codeword_to_digit(
-        self, codeword: str, codeword_length: int, char_to_value: dict[str, int], table_size: int
-    ) -> int:
-        if len(codeword) != codeword_length:
-            raise ValueError("Encountered a codeword with invalid length.")
-        digits = [self._lookup_value(ch, char_to_value) for ch in codeword]
-        digit = self._base_digits_to_int(digits, table_size)
-        if digit >= table_size**codeword_length:
-            raise ValueError("Encountered a codeword that is outside of the codebook.")
-        return digit
-
     def _int_to_base_digits(self, value: int, base: int) -> List[int]:
         if base < 2:
             raise ValueError("Base must be at least 2.")
         if value == 0:
             return [0]
+        if base & (base - 1) == 0:
+            return self._int_to_pow2_digits(value, base)
+        if gmpy2 is not None and base <= _GMP_MAX_BASE:
+            digit_values = _GMP_DIGIT_VALUES_LOWER if base <= 36 else _GMP_DIGIT_VALUES_MIXED
+            return [digit_values[ch] for ch in gmpy2.mpz(value).digits(base)]
+        if value.bit_length() >= _DC_MIN_BITS:
+            return self._int_to_base_digits_dc(value, base)
         digits = []
         while value > 0:
             value, remainder = divmod(value, base)
@@ -151,31 +302,128 @@ class ReversibleTableCodec:
         digits.reverse()
         return digits
 
+    def _int_to_base_digits_dc(self, value: int, base: int) -> List[int]:
+        """Divide-and-conquer radix conversion for large values.
+
+        Splits the value on precomputed base**(2**k) powers so every divmod
+        halves the operand, replacing the quadratic digit-at-a-time loop with
+        O(M(n) log n) work.
+        """
+        powers = [base]
+        while powers[-1] * powers[-1] <= value:
+            powers.append(powers[-1] * powers[-1])
+
+        def split(chunk: int, level: int) -> List[int]:
+            # Digits of `chunk`, zero-padded to the 2**(level + 1) width that
+            # a chunk below powers[level]**2 occupies.
+            if level < 0 or chunk.bit_length() < _DC_MIN_BITS:
+                digits: List[int] = []
+                while chunk > 0:
+                    chunk, remainder = divmod(chunk, base)
+                    digits.append(remainder)
+                digits.reverse()
+                width = 1 << (level + 1)
+                return [0] * (width - len(digits)) + digits
+            high, low = divmod(chunk, powers[level])
+            return split(high, level - 1) + split(low, level - 1)
+
+        top = len(powers) - 1
+        high, low = divmod(value, powers[top])
+        digits = split(high, top - 1) + split(low, top - 1)
+        first_nonzero = next(idx for idx, digit in enumerate(digits) if digit)
+        return digits[first_nonzero:]
+
+    def _int_to_pow2_digits(self, value: int, base: int) -> List[int]:
+        bits_per_digit = base.bit_length() - 1
+        if 8 % bits_per_digit == 0:
+            raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+            if bits_per_digit == 8:
+                return list(raw)
+            byte_digits = _pow2_byte_digits(bits_per_digit)
+            digits: List[int] = []
+            for byte in raw:
+                digits.extend(byte_digits[byte])
+            # to_bytes pads to whole bytes; drop the leading zero digits that adds.
+            needed = -(-value.bit_length() // bits_per_digit)
+            return digits[len(digits) - needed :]
+        bits = bin(value)[2:]
+        padding = -len(bits) % bits_per_digit
+        if padding:
+            bits = "0" * padding + bits
+        return [int(bits[i : i + bits_per_digit], 2) for i in range(0, len(bits), bits_per_digit)]
+
+    def _pow2_digits_to_bytes(self, digits: List[int], base: int) -> bytes:
+        """Pack base digits into bytes when the base is a power of two.
+
+        Blocks of digits whose bits tile whole bytes are accumulated in a
+        native int and emitted with to_bytes; leading zero bytes are stripped
+        to match the minimal to_bytes rendering of the payload integer.
+        """
+        bits_per_digit = base.bit_length() - 1
+        block_digits = 8 // math.gcd(bits_per_digit, 8)
+        block_bytes = bits_per_digit * block_digits // 8
+        padding = -len(digits) % block_digits
+        if padding:
+            digits = [0] * padding + digits
+
+        out = bytearray(len(digits) // block_digits * block_bytes)
+        pos = 0
+        for i in range(0, len(digits), block_digits):
+            block = 0
+            for digit in digits[i : i + block_digits]:
+                block = (block << bits_per_digit) | digit
+            out[pos : pos + block_bytes] = block.to_bytes(block_bytes, "big")
+            pos += block_bytes
+
+        first_nonzero = next((idx for idx, byte in enumerate(out) if byte), max(0, len(out) - 1))
+        return bytes(out[first_nonzero:])
+
     def _base_digits_to_int(self, digits: Iterable[int], base: int) -> int:
+        digit_list = digits if isinstance(digits, list) else list(digits)
+        # Validate bounds once with C-level min/max scans instead of branching
+        # on every digit inside the hot loops below.
+        if digit_list and (min(digit_list) < 0 or max(digit_list) >= base):
+            raise ValueError("Digit outside base range encountered during conversion.")
+        if base == 256:
+            return int.from_bytes(bytes(digit_list), "big")
+        if gmpy2 is not None and 2 <= base <= _GMP_MAX_BASE:
+            if not digit_list:
+                return 0
+            alphabet = _GMP_DIGITS_LOWER if base <= 36 else _GMP_DIGITS_MIXED
+            return int(gmpy2.mpz("".join(map(alphabet.__getitem__, digit_list)), base))
+        if len(digit_list) >= _DC_MIN_DIGITS:
+            return self._base_digits_to_int_dc(digit_list, base)
         value = 0
-        for digit in digits:
-            if digit < 0 or digit >= base:
-                raise ValueError("Digit outside base range encountered during conversion.")
+        # Pack as many digits as fit in a native word per block, so bignum
+        # multiplications happen at block rather than digit granularity.
+        chunk = 63 // base.bit_length()
+        if chunk > 1:
+            head = len(digit_list) % chunk
+            for digit in digit_list[:head]:
+                value = value * base + digit
+            base_chunk = base**chunk
+            for i in range(head, len(digit_list), chunk):
+                block = 0
+                for digit in digit_list[i : i + chunk]:
+                    block = block * base + digit
+                value = value * base_chunk + block
+            return value
+        for digit in digit_list:
             value = value * base + digit
         return value
 
+    def _base_digits_to_int_dc(self, digits: List[int], base: int) -> int:
+        """Recursive halving combine for long digit lists (already range-checked)."""
+        if len(digits) < _DC_MIN_DIGITS:
+            return self._base_digits_to_int(digits, base)
+        half = len(digits) // 2
+        high = self._base_digits_to_int_dc(digits[:-half], base)
+        low = self._base_digits_to_int_dc(digits[-half:], base)
+        return high * base**half + low
+
     def _int_to_base_fixed_width(self, value: int, base: int, width: int) -> List[int]:
         digits = self._int_to_base_digits(value, base)
         if len(digits) > width:
             raise ValueError("Value does not fit in the requested width.")
         padding = [0] * (width - len(digits))
         return padding + digits
-
-    def _count_digits(self, value: int, base: int) -> int:
-        if value == 0:
-            return 1
-        count = 0
-        while value:
-            value //= base
-            count += 1
-        return count
-
-    def _lookup_value(self, ch: str, lookup: dict[str, int]) -> int:
-        if ch not in lookup:
-            raise ValueError(f"Encountered character {repr(ch)} that is not in the table.")
-        return lookup[ch]
@@ -30,6 +30,29 @@ def test_table_deduplicates_preserving_order() -> None:
     assert set(encoded).issubset(set(deduped))
 
 
+def test_decode_accepts_pre_streaming_hex_rendering() -> None:
+    # Emitted for ("0123456789ABCDEF", "Hi") before encode streamed bytes
+    # through the byte LUT: the body starts at the first significant digit
+    # instead of carrying the sentinel byte's leading zero digit.
+    codec = ReversibleTableCodec()
+    assert codec.decode("0123456789ABCDEF", "0001100000000000000024869") == "Hi"
+
+
+@pytest.mark.parametrize("table_size", [2, 4, 16, 256])
+def test_pow2_tables_decode_both_body_renderings(table_size: int) -> None:
+    table = "".join(chr(0x4E00 + i) for i in range(table_size))
+    codec = ReversibleTableCodec()
+    message = "wire format stability 世界"
+    encoded = codec.encode(table, message)
+    assert codec.decode(table, encoded) == message
+    # The minimal rendering (no leading zero digits in the body) must stay
+    # decodable alongside the streamed whole-byte rendering.
+    header = encoded[: ReversibleTableCodec.LENGTH_PREFIX_WIDTH]
+    body = encoded[ReversibleTableCodec.LENGTH_PREFIX_WIDTH :]
+    minimal = header + body.lstrip(table[0])
+    assert codec.decode(table, minimal) == message
+
+
 def test_table_requires_two_distinct_chars() -> None:
     codec = ReversibleTableCodec()
     with pytest.raises(ValueError):